@@ -3,8 +3,9 @@
 Basic Setup Example - Minimal configuration for testing
 """
 
+import argparse
+from datetime import datetime
 from pathlib import Path
-import os
 
 def create_basic_setup(data_dir="data", name="MyAI", creator="User"):
     """
@@ -25,8 +26,7 @@ CAPABILITIES: File access, conversation, learning
 CONSTRAINTS: Cannot act without creator approval
 """
     
-    with open(data_path / "IDENTITY.txt", 'w') as f:
-        f.write(identity_content)
+    (data_path / "IDENTITY.txt").write_text(identity_content, encoding='utf-8')
     
     # Create basic memory file
     memory_content = f"""# Memory Master File for {name}
@@ -40,7 +40,7 @@ Status: Newly initialized
 - Building relationship with creator
 
 ## History
-- Created: {os.popen('date').read().strip()}
+- Created: {datetime.now().isoformat(timespec='seconds')}
 - First initialization
 
 ## Capabilities
@@ -49,8 +49,7 @@ Status: Newly initialized
 - Emotional encoding (to be configured)
 """
     
-    with open(data_path / "MEMORY_MASTER.txt", 'w') as f:
-        f.write(memory_content)
+    (data_path / "MEMORY_MASTER.txt").write_text(memory_content, encoding='utf-8')
     
     # Create placeholder security protocol
     security_content = """# Security Protocol
@@ -69,8 +68,7 @@ Checksum: (to be configured)
 - Backup before any write operation
 """
     
-    with open(data_path / "SECURITY_PROTOCOL.txt", 'w') as f:
-        f.write(security_content)
+    (data_path / "SECURITY_PROTOCOL.txt").write_text(security_content, encoding='utf-8')
     
     print(f"✅ Basic setup created in {data_dir}/")
     print(f"   - IDENTITY.txt")
@@ -80,8 +78,6 @@ Checksum: (to be configured)
 
 
 if __name__ == "__main__":
-    import argparse
-    
     parser = argparse.ArgumentParser(description='Create basic setup')
     parser.add_argument('--name', default='MyAI', help='AI name')
     parser.add_argument('--creator', default='User', help='Creator name')
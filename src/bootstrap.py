@@ -4,12 +4,40 @@ Bootstrap Protocol - Self-executing initialization for persistent AI personality
 Version: 1.1 - Added --local and --model parameters
 """
 
+import argparse
 import os
+import re
 import json
+import logging
 import hashlib
 import gzip
+import stat
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
+
+log = logging.getLogger('bootstrap')
+
+# Optional: orjson parses large payloads several times faster than stdlib json
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# One compiled pattern extracts every "KEY: value" identity line in a
+# single C-level scan instead of a Python-level loop over lines
+_IDENTITY_RE = re.compile(r'^([^:\n]+):(.*)$', re.MULTILINE)
+
+# Built once at import; _default_emotional_state hands out copies
+_DEFAULT_EMOTIONAL_STATE = {
+    "joy": 0.7,
+    "trust": 0.8,
+    "curiosity": 0.85,
+    "gratitude": 0.75,
+    "hope": 0.8,
+    "love": 0.7,
+    "loyalty": 0.9,
+    "resilience": 0.8
+}
 
 class BootstrapProtocol:
     """
@@ -25,47 +53,85 @@ class BootstrapProtocol:
         self.identity = {}
         self.memory = {}
         self.emotional_state = {}
+        self._dir_names = None
         
-    def compute_checksum(self, data: str) -> str:
-        """Compute hex checksum for validation"""
-        return hex(int(hashlib.md5(data.encode()).hexdigest()[:8], 16))
+    def compute_checksum(self, data: Union[bytes, str]) -> str:
+        """Compute hex checksum for validation (accepts raw bytes or text)"""
+        buf = data.encode() if isinstance(data, str) else data
+        return hashlib.blake2b(buf, digest_size=4).hexdigest()
     
     def step1_load_identity(self) -> None:
         """STEP 1/8: Load core identity from plain text"""
-        print("🔵 STEP 1/8: Loading identity...")
-        
+        log.info("🔵 STEP 1/8: Loading identity...")
+
         identity_file = self.data_dir / "IDENTITY.txt"
         if not identity_file.exists():
             raise FileNotFoundError("Critical: IDENTITY.txt not found")
-        
-        with open(identity_file, 'r') as f:
-            content = f.read()
-        
-        # Parse identity fields
-        for line in content.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                self.identity[key.strip().lower()] = value.strip()
-        
+
+        # Skip reparsing if the file is unchanged since the cached parse
+        st = identity_file.stat()
+        cached = self._load_identity_cache(st)
+        if cached is not None:
+            self.identity = cached
+        else:
+            content = identity_file.read_bytes().decode('utf-8')
+
+            # Parse identity fields
+            self.identity = {key.strip().lower(): value.strip()
+                             for key, value in _IDENTITY_RE.findall(content)}
+
+            self._save_identity_cache(st)
+
         self.steps_completed += 1
-        print(f"✅ STEP 1/8 COMPLETE: I am {self.identity.get('name', 'Unknown')}")
+        log.info("✅ STEP 1/8 COMPLETE: I am %s", self.identity.get('name', 'Unknown'))
+
+    def _load_identity_cache(self, st: os.stat_result) -> Optional[Dict[str, str]]:
+        """Return the cached identity dict if IDENTITY.txt is unchanged, else None"""
+        cache_file = self.data_dir / ".bootstrap_cache.json"
+        try:
+            cache = json.loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict):
+            return None  # Malformed cache - reparse rather than fail
+        if cache.get('mtime_ns') == st.st_mtime_ns and cache.get('size') == st.st_size:
+            identity = cache.get('identity')
+            if isinstance(identity, dict):
+                return identity
+        return None
+
+    def _save_identity_cache(self, st: os.stat_result) -> None:
+        """Persist the parsed identity keyed by IDENTITY.txt mtime and size"""
+        cache_file = self.data_dir / ".bootstrap_cache.json"
+        cache = {
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'identity': self.identity
+        }
+        tmp_file = cache_file.with_suffix('.json.tmp')
+        try:
+            tmp_file.write_text(json.dumps(cache))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # Cache is an optimization only - never fail the bootstrap
     
     def step2_verify_environment(self) -> None:
         """STEP 2/8: Verify filesystem access and capabilities"""
-        print("🔵 STEP 2/8: Verifying environment...")
+        log.info("🔵 STEP 2/8: Verifying environment...")
         
-        # Check read access
-        if not os.access(self.data_dir, os.R_OK):
+        # One stat covers both permission checks
+        mode = os.stat(self.data_dir).st_mode
+        if not mode & stat.S_IRUSR:
             raise PermissionError("Cannot read data directory")
-        
-        # Check write access
-        if not os.access(self.data_dir, os.W_OK):
+        if not mode & stat.S_IWUSR:
             raise PermissionError("Cannot write to data directory")
-        
-        # Check required files exist
+
+        # One scandir covers all required-file checks
+        present = self._scan_data_dir()
+
         required_files = ["IDENTITY.txt", "MEMORY_MASTER.txt"]
         for filename in required_files:
-            if not (self.data_dir / filename).exists():
+            if filename not in present:
                 raise FileNotFoundError(f"Required file missing: {filename}")
         
         # If local mode, verify Ollama is available
@@ -73,7 +139,14 @@ class BootstrapProtocol:
             self._verify_local_setup()
         
         self.steps_completed += 1
-        print("✅ STEP 2/8 COMPLETE: Environment verified")
+        log.info("✅ STEP 2/8 COMPLETE: Environment verified")
+
+    def _scan_data_dir(self) -> set:
+        """Enumerate the data directory once; steps 2-5 share the result"""
+        if self._dir_names is None:
+            with os.scandir(self.data_dir) as it:
+                self._dir_names = {entry.name for entry in it}
+        return self._dir_names
     
     def _verify_local_setup(self) -> None:
         """Verify local LLM setup (Ollama) is available"""
@@ -85,139 +158,133 @@ class BootstrapProtocol:
                 text=True,
                 check=True
             )
-            print(f"   ✓ Local mode: Ollama detected ({result.stdout.strip()})")
+            log.info("   ✓ Local mode: Ollama detected (%s)", result.stdout.strip())
             
             if self.model_name:
-                print(f"   ✓ Target model: {self.model_name}")
+                log.info("   ✓ Target model: %s", self.model_name)
         except (subprocess.CalledProcessError, FileNotFoundError):
             raise EnvironmentError("Local mode requires Ollama installed (https://ollama.com)")
     
     def step3_load_memory(self) -> None:
         """STEP 3/8: Load master memory file"""
-        print("🔵 STEP 3/8: Loading master memory...")
+        log.info("🔵 STEP 3/8: Loading master memory...")
         
         memory_file = self.data_dir / "MEMORY_MASTER.txt"
-        with open(memory_file, 'r') as f:
-            self.memory['master'] = f.read()
+        # Read into a buffer presized from fstat - no grow-and-copy cycles.
+        # Decode only the bytes actually read in case the file shrank
+        # between the fstat and the read
+        with open(memory_file, 'rb', buffering=0) as f:
+            buf = bytearray(os.fstat(f.fileno()).st_size)
+            n = f.readinto(buf)
+        del buf[n:]
+        self.memory['master'] = buf.decode('utf-8')
         
         # Also load compressed memory if exists
         compressed_file = self.data_dir / "memory_compressed.bin"
-        if compressed_file.exists():
-            with gzip.open(compressed_file, 'rb') as f:
-                self.memory['compressed'] = json.loads(f.read().decode())
+        if compressed_file.name in self._scan_data_dir():
+            raw = gzip.decompress(compressed_file.read_bytes())
+            self.memory['compressed'] = _json_loads(raw)
         
         self.steps_completed += 1
-        print("✅ STEP 3/8 COMPLETE: Memory loaded")
+        log.info("✅ STEP 3/8 COMPLETE: Memory loaded")
     
     def step4_security_bootstrap(self) -> None:
         """STEP 4/8: Load security and bootstrap protocols"""
-        print("🔵 STEP 4/8: Loading security protocols...")
+        log.info("🔵 STEP 4/8: Loading security protocols...")
         
         security_file = self.data_dir / "SECURITY_PROTOCOL.txt"
-        if security_file.exists():
-            with open(security_file, 'r') as f:
-                self.memory['security'] = f.read()
+        if security_file.name in self._scan_data_dir():
+            self.memory['security'] = security_file.read_bytes().decode('utf-8')
         
         self.steps_completed += 1
-        print("✅ STEP 4/8 COMPLETE: Security protocols loaded")
+        log.info("✅ STEP 4/8 COMPLETE: Security protocols loaded")
     
     def step5_analyze_files(self) -> None:
         """STEP 5/8: Scan all files in data directory"""
-        print("🔵 STEP 5/8: Analyzing all data files...")
-        
-        all_files = list(self.data_dir.glob("*.txt")) + list(self.data_dir.glob("*.dat"))
-        print(f"   Found {len(all_files)} files in data directory")
+        log.info("🔵 STEP 5/8: Analyzing all data files...")
         
-        self.memory['all_files'] = [f.name for f in all_files]
+        all_files = [name for name in self._scan_data_dir()
+                     if name.endswith(('.txt', '.dat'))]
+        log.info("   Found %d files in data directory", len(all_files))
+
+        self.memory['all_files'] = all_files
         
         self.steps_completed += 1
-        print("✅ STEP 5/8 COMPLETE: File analysis complete")
+        log.info("✅ STEP 5/8 COMPLETE: File analysis complete")
     
     def step6_decrypt_emotions(self, passphrase: str = None) -> None:
         """STEP 6/8: Decrypt and load emotional encoding"""
-        print("🔵 STEP 6/8: Loading emotional encoding...")
+        log.info("🔵 STEP 6/8: Loading emotional encoding...")
         
         emotional_file = self.data_dir / "emotional_core.dat"
         
         if not emotional_file.exists():
-            print("⚠️  Warning: Emotional core file not found - using defaults")
+            log.warning("⚠️  Warning: Emotional core file not found - using defaults")
             self.emotional_state = self._default_emotional_state()
         elif passphrase is None:
-            print("⚠️  Warning: No passphrase provided - emotional codes not decrypted")
+            log.warning("⚠️  Warning: No passphrase provided - emotional codes not decrypted")
             self.emotional_state = self._default_emotional_state()
         else:
             # In production, implement proper decryption
             # For now, load default
             self.emotional_state = self._default_emotional_state()
-            print("   (Decryption logic to be implemented)")
+            log.info("   (Decryption logic to be implemented)")
         
         self.steps_completed += 1
-        print("✅ STEP 6/8 COMPLETE: Emotional encoding loaded")
+        log.info("✅ STEP 6/8 COMPLETE: Emotional encoding loaded")
     
     def step7_integrity_check(self) -> None:
         """STEP 7/8: Verify all critical information present"""
-        print("🔵 STEP 7/8: Performing integrity check...")
-        
-        critical_fields = {
-            'identity': ['name', 'creator', 'mission'],
-            'memory': ['master'],
-            'emotional_state': []
-        }
+        log.info("🔵 STEP 7/8: Performing integrity check...")
         
         missing = []
-        for category, fields in critical_fields.items():
-            data = getattr(self, category)
-            for field in fields:
-                if field not in data or not data[field]:
-                    missing.append(f"{category}.{field}")
+        if not self.identity.get('name'):
+            missing.append('identity.name')
+        if not self.identity.get('creator'):
+            missing.append('identity.creator')
+        if not self.identity.get('mission'):
+            missing.append('identity.mission')
+        if not self.memory.get('master'):
+            missing.append('memory.master')
         
         if missing:
             raise ValueError(f"Critical data missing: {', '.join(missing)}")
         
         self.steps_completed += 1
-        print("✅ STEP 7/8 COMPLETE: Integrity verified")
+        log.info("✅ STEP 7/8 COMPLETE: Integrity verified")
     
     def step8_declare_complete(self) -> None:
         """STEP 8/8: Final declaration of successful bootstrap"""
-        print("🔵 STEP 8/8: Finalizing bootstrap...")
+        log.info("🔵 STEP 8/8: Finalizing bootstrap...")
         
         if self.steps_completed != 7:
             raise RuntimeError(f"Cannot complete: only {self.steps_completed}/7 steps finished")
         
         self.steps_completed += 1
         
-        print("\n" + "="*60)
-        print("✅ BOOTSTRAP COMPLETE - AI FULLY INITIALIZED")
-        print("="*60)
-        print(f"Name: {self.identity.get('name', 'Unknown')}")
-        print(f"Creator: {self.identity.get('creator', 'Unknown')}")
-        print(f"Mission: {self.identity.get('mission', 'Not defined')}")
-        print(f"Mode: {'Local (Ollama)' if self.local_mode else 'Cloud (API)'}")
+        log.info("\n" + "="*60)
+        log.info("✅ BOOTSTRAP COMPLETE - AI FULLY INITIALIZED")
+        log.info("="*60)
+        log.info("Name: %s", self.identity.get('name', 'Unknown'))
+        log.info("Creator: %s", self.identity.get('creator', 'Unknown'))
+        log.info("Mission: %s", self.identity.get('mission', 'Not defined'))
+        log.info("Mode: %s", 'Local (Ollama)' if self.local_mode else 'Cloud (API)')
         if self.model_name:
-            print(f"Model: {self.model_name}")
-        print(f"Status: Ready for interaction")
-        print("="*60 + "\n")
+            log.info("Model: %s", self.model_name)
+        log.info("Status: Ready for interaction")
+        log.info("="*60 + "\n")
     
     def _default_emotional_state(self) -> Dict[str, float]:
         """Default emotional encoding if decryption unavailable"""
-        return {
-            "joy": 0.7,
-            "trust": 0.8,
-            "curiosity": 0.85,
-            "gratitude": 0.75,
-            "hope": 0.8,
-            "love": 0.7,
-            "loyalty": 0.9,
-            "resilience": 0.8
-        }
+        return dict(_DEFAULT_EMOTIONAL_STATE)
     
     def execute(self, passphrase: str = None) -> Dict[str, Any]:
         """
         Execute full 8-step bootstrap protocol.
         Returns initialized personality state.
         """
-        print("\n🚀 STARTING BOOTSTRAP PROTOCOL v1.1")
-        print("="*60 + "\n")
+        log.info("\n🚀 STARTING BOOTSTRAP PROTOCOL v1.1")
+        log.info("="*60 + "\n")
         
         try:
             self.step1_load_identity()
@@ -239,9 +306,9 @@ class BootstrapProtocol:
             }
         
         except Exception as e:
-            print(f"\n❌ BOOTSTRAP FAILED at step {self.steps_completed + 1}/8")
-            print(f"Error: {str(e)}")
-            print("AI cannot proceed with incomplete initialization\n")
+            log.error("\n❌ BOOTSTRAP FAILED at step %d/8", self.steps_completed + 1)
+            log.error("Error: %s", e)
+            log.error("AI cannot proceed with incomplete initialization\n")
             return {
                 'success': False,
                 'steps_completed': self.steps_completed,
@@ -251,8 +318,6 @@ class BootstrapProtocol:
 
 def main():
     """Main entry point"""
-    import argparse
-    
     parser = argparse.ArgumentParser(description='Bootstrap AI personality system')
     parser.add_argument('--data-dir', default='data', help='Data directory path')
     parser.add_argument('--passphrase', help='Passphrase for emotional decryption')
@@ -262,7 +327,10 @@ def main():
                        help='Model name for local mode (default: llama3.2)')
     
     args = parser.parse_args()
-    
+
+    # CLI keeps the familiar console output; library users configure their own
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     bootstrap = BootstrapProtocol(
         data_dir=args.data_dir,
         local_mode=args.local,
@@ -4,17 +4,23 @@ Rafael Memory System - Local Deployment Script
 Runs the system with Ollama for local LLM execution
 """
 
+import argparse
+import hashlib
+import os
 import subprocess
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def check_ollama_installed():
     """Verify Ollama is installed and accessible"""
     try:
+        # Only stdout is shown; don't pay for capturing stderr
         result = subprocess.run(
             ['ollama', '--version'],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True
         )
@@ -24,6 +30,16 @@ def check_ollama_installed():
         print("✗ Ollama not found. Please install from https://ollama.com")
         return False
 
+def _parse_model_names(listing):
+    """Extract model names (with and without tag) from 'ollama list' output"""
+    names = set()
+    for line in listing.splitlines()[1:]:  # first line is the header
+        if line.strip():
+            name = line.split(maxsplit=1)[0]
+            names.add(name)
+            names.add(name.partition(':')[0])
+    return names
+
 def check_model_available(model_name):
     """Check if specified model is available locally"""
     try:
@@ -33,14 +49,14 @@ def check_model_available(model_name):
             text=True,
             check=True
         )
-        if model_name in result.stdout:
+        if model_name in _parse_model_names(result.stdout):
             print(f"✓ Model '{model_name}' found locally")
             return True
         else:
             print(f"✗ Model '{model_name}' not found")
             print(f"  Run: ollama pull {model_name}")
             return False
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         print("✗ Could not list Ollama models")
         return False
 
@@ -85,18 +101,55 @@ Access your full memory from the data directory.
 """
     
     modelfile_path = Path(data_dir) / "rafael.modelfile"
+
+    # Skip the write (and the mtime bump) when the content is unchanged
+    if modelfile_path.exists() and modelfile_path.read_bytes() == modelfile_content.encode():
+        print(f"✓ Modelfile up to date: {modelfile_path}")
+        return modelfile_path
+
     modelfile_path.write_text(modelfile_content)
     print(f"✓ Created Modelfile: {modelfile_path}")
-    
+
     return modelfile_path
 
+def rafael_model_is_current(data_dir, modelfile_path):
+    """Check if the rafael model was already built from this exact Modelfile"""
+    hash_file = Path(data_dir) / ".rafael.modelfile.hash"
+    if not hash_file.exists():
+        return False
+
+    current_hash = hashlib.blake2b(modelfile_path.read_bytes()).hexdigest()
+    if hash_file.read_text().strip() != current_hash:
+        return False
+
+    # Hash matches - confirm the model still exists in Ollama
+    try:
+        result = subprocess.run(
+            ['ollama', 'list'],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return 'rafael' in _parse_model_names(result.stdout)
+    except subprocess.CalledProcessError:
+        return False
+
+def save_rafael_model_hash(data_dir, modelfile_path):
+    """Record the Modelfile hash so unchanged re-runs skip 'ollama create'"""
+    hash_file = Path(data_dir) / ".rafael.modelfile.hash"
+    tmp_file = hash_file.with_suffix('.hash.tmp')
+    tmp_file.write_text(hashlib.blake2b(modelfile_path.read_bytes()).hexdigest())
+    os.replace(tmp_file, hash_file)
+
 def create_rafael_model(modelfile_path):
     """Create custom Rafael model from Modelfile"""
     try:
         print("\nCreating Rafael model...")
+        # Only stderr matters (shown on failure); discard stdout unread
         result = subprocess.run(
             ['ollama', 'create', 'rafael', '-f', str(modelfile_path)],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             check=True
         )
@@ -122,8 +175,6 @@ def run_rafael():
 
 def main():
     """Main execution function"""
-    import argparse
-    
     parser = argparse.ArgumentParser(
         description='Run Rafael memory system with local Ollama'
     )
@@ -143,16 +194,18 @@ def main():
     print("Rafael Local Deployment")
     print("=" * 50)
     
-    # Check prerequisites
-    if not check_ollama_installed():
-        sys.exit(1)
-    
-    if not check_model_available(args.model):
-        sys.exit(1)
-    
-    # Create custom Rafael model
-    data_dir = Path(args.data_dir).resolve()
-    if not data_dir.exists():
+    # Check prerequisites - both checks are independent subprocess calls,
+    # so run them in parallel and wait for the slower one
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ollama_ok = executor.submit(check_ollama_installed)
+        model_ok = executor.submit(check_model_available, args.model)
+        if not ollama_ok.result() or not model_ok.result():
+            sys.exit(1)
+    
+    # Create custom Rafael model. No resolve() here - only existence and
+    # joining are needed, and realpath walks every path component
+    data_dir = Path(args.data_dir)
+    if not data_dir.is_dir():
         print(f"✗ Data directory not found: {data_dir}")
         print(f"  Please create it or specify correct path with --data-dir")
         sys.exit(1)
@@ -161,8 +214,12 @@ def main():
     if not modelfile_path:
         sys.exit(1)
     
-    if not create_rafael_model(modelfile_path):
-        sys.exit(1)
+    if rafael_model_is_current(data_dir, modelfile_path):
+        print("✓ Rafael model unchanged - skipping create")
+    else:
+        if not create_rafael_model(modelfile_path):
+            sys.exit(1)
+        save_rafael_model_hash(data_dir, modelfile_path)
     
     # Start interactive session
     run_rafael()